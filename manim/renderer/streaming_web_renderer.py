@@ -5,258 +5,132 @@ Perfect for React Native webviews and live preview
 
 from __future__ import annotations
 
-import json
+import base64
+import gzip
 import os
+import queue
+import struct
+import threading
+from string import Template
 from typing import Any, Dict, Callable
 
 import numpy as np
+import orjson
 from manim.camera.moving_camera import MovingCamera
 from manim.renderer.cairo_renderer import CairoRenderer
 from manim.mobject.types.vectorized_mobject import VMobject
 from manim.utils.color import ManimColor
+from manim.utils.family import extract_mobject_family_members
 from manim import config, logger
 
+try:
+    from numba import njit
 
-class StreamingWebCamera(MovingCamera):
-    """Camera that streams frames as they're generated with MovingCamera support"""
+    numba_imported = True
+except ImportError:
+    numba_imported = False
 
-    def __init__(self, *args, on_frame_callback=None, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.frame_data = []
-        self.on_frame_callback = on_frame_callback
-        self.frame_count = 0
+try:
+    import msgpack
 
-    def reset_frame_data(self):
-        self.frame_data = []
+    msgpack_imported = True
+except ImportError:
+    msgpack_imported = False
 
-    def display_multiple_vectorized_mobjects(self, vmobjects: list[VMobject], pixel_array) -> None:
-        """Capture VMobject data"""
-        added_count = 0
-        skipped_count = 0
-        transparent_count = 0
 
-        for vm in vmobjects:
-            points = vm.points.tolist()
+if numba_imported:
 
-            # Skip mobjects with no points - they're invisible
-            if not points or len(points) == 0:
-                skipped_count += 1
-                continue
+    @njit(cache=True, fastmath=True)
+    def _affine_quantize(points, a, tx, d, ty, scale):
+        """Fused to-canvas transform + fixed-point quantization.
 
-            fill_color = vm.fill_color
-            if isinstance(fill_color, ManimColor):
-                fill_color = fill_color.to_hex()
-
-            stroke_color = vm.stroke_color
-            if isinstance(stroke_color, ManimColor):
-                stroke_color = stroke_color.to_hex()
-
-            fill_opacity = float(vm.fill_opacity)
-            stroke_width = float(vm.stroke_width)
-            stroke_opacity = float(vm.stroke_opacity)
-
-            # IMPORTANT: Use get_fill_rgbas() and get_stroke_rgbas() like Cairo does
-            # to get the actual colors/opacities used for rendering
-            try:
-                fill_rgbas = vm.get_fill_rgbas()
-                if len(fill_rgbas) > 0:
-                    # Use the alpha channel from the RGBA array (4th component)
-                    actual_fill_opacity = float(fill_rgbas[0][3])
-                    if actual_fill_opacity != fill_opacity:
-                        fill_opacity = actual_fill_opacity
-            except Exception:
-                pass  # Fall back to fill_opacity property
-
-            try:
-                stroke_rgbas = vm.get_stroke_rgbas()
-                if len(stroke_rgbas) > 0:
-                    actual_stroke_opacity = float(stroke_rgbas[0][3])
-                    if actual_stroke_opacity != stroke_opacity:
-                        stroke_opacity = actual_stroke_opacity
-            except Exception:
-                pass  # Fall back to stroke_opacity property
-
-            # Debug: track transparent mobjects
-            if fill_opacity == 0.0 and (stroke_width == 0.0 or stroke_opacity == 0.0):
-                transparent_count += 1
+        One pass over the concatenated (N, 3) points, no temporaries.
+        """
+        n = points.shape[0]
+        out = np.empty(n * 2, dtype=np.int16)
+        for i in range(n):
+            x = (points[i, 0] * a + tx) * scale
+            y = (points[i, 1] * d + ty) * scale
+            x = min(max(x, -32768.0), 32767.0)
+            y = min(max(y, -32768.0), 32767.0)
+            out[2 * i] = round(x)
+            out[2 * i + 1] = round(y)
+        return out
 
-            self.frame_data.append({
-                "type": "VMobject",
-                "points": points,
-                "fill_color": fill_color,
-                "fill_opacity": fill_opacity,
-                "stroke_color": stroke_color,
-                "stroke_width": stroke_width,
-                "stroke_opacity": stroke_opacity,
-            })
-            added_count += 1
+else:
 
-        if skipped_count > 0 or transparent_count > 0:
-            logger.debug(f"  Added {added_count} mobjects ({transparent_count} appear transparent), skipped {skipped_count} with no points")
+    def _affine_quantize(points, a, tx, d, ty, scale):
+        """Vectorized NumPy fallback when numba isn't installed."""
+        big = points[:, :2].astype(np.float32)
+        big[:, 0] *= a
+        big[:, 0] += tx
+        big[:, 1] *= d
+        big[:, 1] += ty
+        big *= scale
+        np.rint(big, out=big)
+        np.clip(big, -32768, 32767, out=big)
+        return big.astype(np.int16).ravel()
 
-    def display_multiple_image_mobjects(self, image_mobjects, pixel_array):
-        pass
 
-    def display_multiple_point_cloud_mobjects(self, pmobjects, pixel_array):
-        pass
+# type -> (has get_fill_rgbas, has get_stroke_rgbas), filled lazily; mobject
+# classes don't grow these methods at runtime
+_RGBAS_CAPABILITY: dict[type, tuple[bool, bool]] = {}
 
 
-class StreamingWebRenderer(CairoRenderer):
-    """
-    Streaming renderer that yields frames as they're generated.
-    Perfect for React Native integration and live preview!
+def _color_to_hex(color: ManimColor) -> str:
+    """Format a color as ``#RRGGBB`` straight from its internal RGB array.
 
-    Usage:
-        renderer = StreamingWebRenderer(on_frame=my_callback)
-        # Callback receives frames in real-time as they're generated
+    ``ManimColor.to_hex`` runs three numpy-scalar conversions and three
+    f-string format ops per call; packing the channels into one integer and
+    formatting once does the same job for the stream's hot path.
     """
-
-    def __init__(self, *args, on_frame_callback=None, **kwargs):
-        self.on_frame_callback = on_frame_callback
-        super().__init__(
-            camera_class=StreamingWebCamera,
-            skip_animations=False,
-            *args,
-            **kwargs
-        )
-        self.camera.on_frame_callback = on_frame_callback
-        self.all_frames = []
-        self.stream_file = None
-
-    def init_scene(self, scene) -> None:
-        config.write_to_movie = False
-
-        # Create streaming HTML file
-        output_dir = config.media_dir
-        os.makedirs(output_dir, exist_ok=True)
-        stream_path = os.path.join(output_dir, "stream.html")
-
-        # Write initial HTML with live streaming capability
-        with open(stream_path, 'w') as f:
-            f.write(self._get_streaming_html_header())
-
-        self.stream_file = stream_path
-        logger.info(f"🔴 LIVE streaming to {stream_path}")
-
-        super().init_scene(scene)
-
-    def render(self, scene, time, moving_mobjects=None):
-        """Render frame and immediately stream it"""
-        self.camera.reset_frame_data()
-
-        # Capture frame - extract ALL family members to include text submobjects
-        from manim.utils.family import extract_mobject_family_members
-        all_mobjects = extract_mobject_family_members(
-            scene.mobjects,
-            only_those_with_points=True,
-        )
-
-        # Filter to VMobjects (includes SVGMobjects like MathTex)
-        vmobjects = [m for m in all_mobjects if isinstance(m, VMobject)]
-
-        # Debug: log mobject count every 30 frames
-        frame_index = len(self.all_frames)
-        if frame_index % 30 == 0:
-            logger.info(f"Frame {frame_index}: {len(scene.mobjects)} scene mobjects, {len(vmobjects)} VMobjects captured")
-
-        self.camera.display_multiple_vectorized_mobjects(vmobjects, None)
-
-        # Debug: log actual frame_data length
-        if frame_index % 30 == 0:
-            logger.info(f"  Frame data contains {len(self.camera.frame_data)} mobjects with points")
-
-        # Capture camera frame transform (for zooming/panning)
-        camera_transform = {
-            "height": float(self.camera.frame.height),
-            "width": float(self.camera.frame.width),
-            "center": self.camera.frame.get_center().tolist()
-        }
-
-        # Create frame data
-        frame_data = {
-            "time": time,
-            "frame_index": len(self.all_frames),
-            "mobjects": self.camera.frame_data,
-            "camera": camera_transform
-        }
-
-        self.all_frames.append(frame_data)
-
-        # STREAM IT IMMEDIATELY!
-        self._stream_frame(frame_data)
-
-        # Also call user callback if provided
-        if self.on_frame_callback:
-            self.on_frame_callback(frame_data)
-
-    def _stream_frame(self, frame_data):
-        """Append frame to HTML file in real-time"""
-        if not self.stream_file:
-            return
-
-        # Append frame data to JavaScript array
-        frame_js = json.dumps(frame_data, separators=(',', ':'))
-
-        with open(self.stream_file, 'a') as f:
-            f.write(f"\n<script>if(window.addFrame)window.addFrame({frame_js});</script>")
-
-    def update_frame(self, scene, mobjects=None, **kwargs):
-        """Skip pixel rendering"""
-        pass
-
-    def freeze_current_frame(self, duration: float) -> None:
-        """Handle wait periods"""
-        dt = 1 / self.camera.frame_rate
-        num_frames = int(duration / dt)
-
-        if self.all_frames:
-            last_frame = self.all_frames[-1]
-            frame_data = last_frame["mobjects"]
-            camera_data = last_frame.get("camera", {
-                "height": 8.0,
-                "width": 8.0 * (config.pixel_width / config.pixel_height),
-                "center": [0, 0, 0]
-            })
-
-            for i in range(num_frames):
-                self.time += dt
-                new_frame = {
-                    "time": self.time,
-                    "frame_index": len(self.all_frames),
-                    "mobjects": frame_data,
-                    "camera": camera_data
-                }
-                self.all_frames.append(new_frame)
-                self._stream_frame(new_frame)
-
-    def scene_finished(self, scene):
-        """Finalize the streaming HTML"""
-        if not self.stream_file:
-            return
-
-        # Write closing HTML
-        with open(self.stream_file, 'a') as f:
-            f.write(self._get_streaming_html_footer())
-
-        num_frames = len(self.all_frames)
-        logger.info(f"✅ Streaming complete: {num_frames} frames")
-        logger.info(f"   Open {self.stream_file} in browser!")
-
-    def _get_streaming_html_header(self):
-        """HTML that loads and starts playing frames as they arrive"""
-        return f"""<!DOCTYPE html>
+    v = color._internal_value
+    return "#%06X" % (
+        (int(v[0] * 255) << 16) | (int(v[1] * 255) << 8) | int(v[2] * 255)
+    )
+
+
+# Binary sidecar stream format: an 8-byte file header (magic + version),
+# then one fixed-size record header per frame followed by its payload.
+# Native consumers can seek record-to-record without parsing any HTML.
+_BIN_MAGIC = b"MLBS"
+_BIN_VERSION = 1
+#: payload length, frame index, payload encoding, reserved
+_BIN_RECORD = struct.Struct("<IIHH")
+_BIN_ENC_JSON = 0
+_BIN_ENC_MSGPACK = 1
+
+
+def _msgpack_default(obj):
+    """msgpack hook for the binary stream: ndarrays (the int16 points pool)
+    ship as raw little-endian bytes instead of boxed element lists."""
+    if isinstance(obj, np.ndarray):
+        return obj.tobytes()
+    raise TypeError(f"cannot msgpack-serialize {type(obj).__name__}")
+
+
+# The viewer page is static except for the canvas size, so it lives here
+# as a module-level template instead of being rebuilt (and every JS brace
+# re-escaped) through an f-string, and the per-frame script-tag framing is
+# precomputed bytes
+_FRAME_PLAIN_PREFIX = b"\n<script>if(window.queueFrame)window.queueFrame("
+_FRAME_PLAIN_SUFFIX = b");</script>"
+_FRAME_GZ_PREFIX = b'\n<script>if(window.addFrameGz)window.addFrameGz("'
+_FRAME_GZ_SUFFIX = b'");</script>'
+
+_STREAMING_HTML_TEMPLATE = Template("""<!DOCTYPE html>
 <html>
 <head>
     <title>ManimLive - LIVE Streaming</title>
     <meta charset="utf-8">
     <style>
-        body {{ margin: 0; background: #111; color: #eee; font-family: monospace; }}
-        canvas {{ display: block; margin: 20px auto; background: #000; border: 2px solid #333; }}
-        #controls {{ text-align: center; padding: 10px; }}
-        #status {{ text-align: center; padding: 5px; font-size: 12px; color: #0f0; }}
-        input[type=range] {{ width: 80%; }}
-        .live {{ color: #f00; animation: blink 1s infinite; }}
-        @keyframes blink {{ 0%, 50% {{ opacity: 1; }} 51%, 100% {{ opacity: 0.3; }} }}
+        body { margin: 0; background: #111; color: #eee; font-family: monospace; }
+        canvas { display: block; margin: 20px auto; background: #000; border: 2px solid #333; }
+        #controls { text-align: center; padding: 10px; }
+        #status { text-align: center; padding: 5px; font-size: 12px; color: #0f0; }
+        input[type=range] { width: 80%; }
+        .live { color: #f00; animation: blink 1s infinite; }
+        @keyframes blink { 0%, 50% { opacity: 1; } 51%, 100% { opacity: 0.3; } }
     </style>
 </head>
 <body>
@@ -281,142 +155,217 @@ class StreamingWebRenderer(CairoRenderer):
         const frameCountEl = document.getElementById('frameCount');
 
         let frames = [];
+        const mobCache = {};  // mobject id -> last full entry, for delta refs
+        const colorTable = [];  // interned color strings, indexed by columns
         let currentFrame = 0;
         let isPlaying = true;
         let lastFrameTime = performance.now();
 
-        canvas.width = {config.pixel_width};
-        canvas.height = {config.pixel_height};
+        canvas.width = $pixel_width;
+        canvas.height = $pixel_height;
 
-        function resize() {{
+        function resize() {
             const scale = Math.min(window.innerWidth / canvas.width, (window.innerHeight - 150) / canvas.height);
             canvas.style.width = (canvas.width * scale) + 'px';
             canvas.style.height = (canvas.height * scale) + 'px';
-        }}
+        }
         window.addEventListener('resize', resize);
         resize();
 
-        // Called by streaming script tags as frames generate
-        window.addFrame = function(frame) {{
-            frames.push(frame);
+        // UI/playback updates shared by every frame arrival
+        function frameAdded() {
             slider.max = frames.length - 1;
             frameCountEl.textContent = frames.length + ' frames';
 
             // Auto-play new frames as they arrive
-            if (isPlaying && currentFrame >= frames.length - 2) {{
+            if (isPlaying && currentFrame >= frames.length - 2) {
                 currentFrame = frames.length - 1;
                 renderFrame(currentFrame);
-            }}
+            }
 
             // Notify React Native
-            if (window.ReactNativeWebView) {{
-                window.ReactNativeWebView.postMessage(JSON.stringify({{
+            if (window.ReactNativeWebView) {
+                window.ReactNativeWebView.postMessage(JSON.stringify({
                     type: 'frame_added',
                     frameIndex: frames.length - 1,
                     totalFrames: frames.length
-                }}));
-            }}
-        }};
+                }));
+            }
+        }
 
-        function renderFrame(index) {{
+        // Called by streaming script tags as frames generate
+        window.addFrame = function(frame) {
+            if (frame.new_colors) {
+                colorTable.push(...frame.new_colors);
+            }
+            if (frame.hold_frames !== undefined) {
+                // A hold directive stands for hold_frames identical frames;
+                // expand it so indices and scrubbing keep working
+                const base = frames[frame.ref_frame] || {};
+                for (let h = 0; h < frame.hold_frames; h++) {
+                    frames.push({
+                        time: frame.time + h * frame.dt,
+                        frame_index: frame.frame_index + h,
+                        mobjects: base.mobjects,
+                        camera: base.camera
+                    });
+                }
+                frameAdded();
+                return;
+            }
+            if (frame.ref_frame !== undefined) {
+                // Hold frame: reuse the referenced frame's content
+                const base = frames[frame.ref_frame];
+                if (base) {
+                    frame.mobjects = base.mobjects;
+                    frame.camera = base.camera;
+                }
+            } else if (frame.mobjects) {
+                // Mobjects arrive as parallel columns; rebuild draw-order
+                // objects here, resolving delta refs (points_start < 0)
+                // against the cache
+                const cols = frame.mobjects;
+                const pool = frame.points_pool || [];
+                // Coordinates arrive as fixed-point integers
+                const inv = frame.points_scale ? 1.0 / frame.points_scale : 1.0;
+                const mobs = [];
+                for (let i = 0; i < cols.id.length; i++) {
+                    if (cols.points_start[i] < 0) {
+                        // Unchanged since an earlier frame
+                        const cached = mobCache[cols.id[i]];
+                        if (cached) mobs.push(cached);
+                        continue;
+                    }
+                    // Materialize and dequantize coordinates now so later
+                    // refs don't depend on this frame's pool
+                    const pts = pool.slice(2 * cols.points_start[i], 2 * cols.points_end[i]);
+                    if (inv !== 1.0) {
+                        for (let k = 0; k < pts.length; k++) pts[k] *= inv;
+                    }
+                    const mob = {
+                        pts: pts,
+                        fill_color: colorTable[cols.fill_color[i]],
+                        fill_opacity: cols.fill_opacity[i],
+                        stroke_color: colorTable[cols.stroke_color[i]],
+                        stroke_width: cols.stroke_width[i],
+                        stroke_opacity: cols.stroke_opacity[i]
+                    };
+                    mobCache[cols.id[i]] = mob;
+                    mobs.push(mob);
+                }
+                frame.mobjects = mobs;
+            }
+            frames.push(frame);
+            frameAdded();
+        };
+
+        // Decoding packed frames is async, so every arrival goes through
+        // one promise chain to preserve stream order (delta refs, holds and
+        // the color table all depend on it)
+        let pendingFrames = Promise.resolve();
+
+        window.queueFrame = function(frame) {
+            pendingFrames = pendingFrames.then(() => window.addFrame(frame));
+        };
+
+        // gzip+base64 packed frame bodies (requires DecompressionStream,
+        // available in all current browsers and RN webviews)
+        window.addFrameGz = function(b64) {
+            pendingFrames = pendingFrames.then(async () => {
+                const bytes = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+                const stream = new Blob([bytes]).stream()
+                    .pipeThrough(new DecompressionStream('gzip'));
+                const json = await new Response(stream).text();
+                window.addFrame(JSON.parse(json));
+            });
+        };
+
+        function renderFrame(index) {
             const frame = frames[index];
             if (!frame) return;
 
             ctx.clearRect(0, 0, canvas.width, canvas.height);
 
             // Get camera transform (with defaults for backward compatibility)
-            const camera = frame.camera || {{
+            const camera = frame.camera || {
                 height: 8.0,
                 width: 8.0 * (canvas.width / canvas.height),
-                center: [0, 0, 0]
-            }};
+                center: [0, 0, 0],
+                scale: canvas.height / 8.0
+            };
 
-            frame.mobjects.forEach(mob => {{
-                if (mob.type === "VMobject") {{
-                    drawVMobject(mob, camera);
-                }}
-            }});
+            (frame.mobjects || []).forEach(mob => drawVMobject(mob, camera));
 
             timeDisplay.textContent = frame.time.toFixed(2) + 's';
             slider.value = index;
             currentFrame = index;
-        }}
-
-        function drawVMobject(mob, camera) {{
-            if (!mob.points || mob.points.length < 4) return;
+        }
 
-            const pts = mob.points;
-            const frameHeight = camera.height;
-            const frameWidth = camera.width;
-            const [centerX, centerY, centerZ] = camera.center;
+        function drawVMobject(mob, camera) {
+            // Flat [x0, y0, x1, y1, ...] coordinates, already transformed to
+            // canvas space on the Python side
+            const pts = mob.pts;
+            if (!pts || pts.length < 8) return;
+            const nPoints = pts.length / 2;
 
-            // Transform from scene coordinates to canvas coordinates
-            const toCanvasX = (x) => ((x - centerX) + frameWidth/2) / frameWidth * canvas.width;
-            const toCanvasY = (y) => (frameHeight/2 - (y - centerY)) / frameHeight * canvas.height;
+            // Pixels per scene unit, for scaling scene-space tolerances
+            const scale = camera.scale || canvas.height / 8.0;
 
             // Match Cairo's tolerance for detecting discontinuities
             const rtol = 1e-5;
-            const atol = 1e-6;
-            const pointsEqual = (p1, p2) => {{
-                if (!p1 || !p2) return false;
-                return Math.abs(p1[0] - p2[0]) <= atol + rtol * Math.abs(p2[0]) &&
-                       Math.abs(p1[1] - p2[1]) <= atol + rtol * Math.abs(p2[1]);
-            }};
+            const atol = 1e-6 * scale;
+            const pointsEqual = (i, j) => {
+                return Math.abs(pts[2*i] - pts[2*j]) <= atol + rtol * Math.abs(pts[2*j]) &&
+                       Math.abs(pts[2*i+1] - pts[2*j+1]) <= atol + rtol * Math.abs(pts[2*j+1]);
+            };
 
             // More forgiving tolerance for closing paths (Manim shapes don't close perfectly)
-            const pointsClose = (p1, p2) => {{
-                if (!p1 || !p2) return false;
-                const dx = p1[0] - p2[0];
-                const dy = p1[1] - p2[1];
-                return Math.sqrt(dx*dx + dy*dy) < 0.15;
-            }};
+            const pointsClose = (i, j) => {
+                const dx = pts[2*i] - pts[2*j];
+                const dy = pts[2*i+1] - pts[2*j+1];
+                return Math.sqrt(dx*dx + dy*dy) < 0.15 * scale;
+            };
 
             // Find subpath break indices (matching Manim's gen_subpaths_from_points_2d)
             const breakIndices = [0];
-            for (let n = 4; n < pts.length; n += 4) {{
+            for (let n = 4; n < nPoints; n += 4) {
                 // Check if points[n-1] != points[n] (discontinuity between segments)
-                if (!pointsEqual(pts[n-1], pts[n])) {{
+                if (!pointsEqual(n-1, n)) {
                     breakIndices.push(n);
-                }}
-            }}
-            breakIndices.push(pts.length);
+                }
+            }
+            breakIndices.push(nPoints);
 
             // Render each subpath separately
-            for (let subIdx = 0; subIdx < breakIndices.length - 1; subIdx++) {{
+            for (let subIdx = 0; subIdx < breakIndices.length - 1; subIdx++) {
                 const start = breakIndices[subIdx];
                 const end = breakIndices[subIdx + 1];
 
                 if (end - start < 4) continue; // Need at least one curve
 
                 ctx.beginPath();
-                ctx.moveTo(toCanvasX(pts[start][0]), toCanvasY(pts[start][1]));
+                ctx.moveTo(pts[2*start], pts[2*start+1]);
 
                 // Draw all curves in this subpath
-                for (let i = start; i + 3 < end; i += 4) {{
-                    const h1 = pts[i+1];
-                    const h2 = pts[i+2];
-                    const nextAnchor = pts[i+3];
-
-                    if (!h1 || !h2 || !nextAnchor) continue;
-
+                for (let i = start; i + 3 < end; i += 4) {
                     ctx.bezierCurveTo(
-                        toCanvasX(h1[0]), toCanvasY(h1[1]),
-                        toCanvasX(h2[0]), toCanvasY(h2[1]),
-                        toCanvasX(nextAnchor[0]), toCanvasY(nextAnchor[1])
+                        pts[2*(i+1)], pts[2*(i+1)+1],
+                        pts[2*(i+2)], pts[2*(i+2)+1],
+                        pts[2*(i+3)], pts[2*(i+3)+1]
                     );
-                }}
+                }
 
                 // Close subpath if start and end are close
-                if (pointsClose(pts[start], pts[end - 1])) {{
+                if (pointsClose(start, end - 1)) {
                     ctx.closePath();
-                }}
+                }
 
                 // Fill and stroke this subpath
                 ctx.fillStyle = mob.fill_color || '#FFFFFF';
                 ctx.globalAlpha = mob.fill_opacity || 0;
                 ctx.fill('evenodd');
 
-                if ((mob.stroke_width || 0) > 0) {{
+                if ((mob.stroke_width || 0) > 0) {
                     ctx.strokeStyle = mob.stroke_color || '#FFFFFF';
                     ctx.lineWidth = mob.stroke_width;
                     ctx.lineJoin = 'miter';
@@ -424,85 +373,638 @@ class StreamingWebRenderer(CairoRenderer):
                     ctx.miterLimit = 10;
                     ctx.globalAlpha = mob.stroke_opacity || 0;
                     ctx.stroke();
-                }}
-            }}
+                }
+            }
 
             ctx.globalAlpha = 1.0;
-        }}
+        }
 
-        slider.addEventListener('input', (e) => {{
+        slider.addEventListener('input', (e) => {
             currentFrame = parseInt(e.target.value);
             renderFrame(currentFrame);
-        }});
+        });
 
-        playPauseBtn.addEventListener('click', () => {{
+        playPauseBtn.addEventListener('click', () => {
             isPlaying = !isPlaying;
             playPauseBtn.textContent = isPlaying ? 'Pause' : 'Play';
-            if (isPlaying) {{
+            if (isPlaying) {
                 lastFrameTime = performance.now();
                 loop();
-            }}
-        }});
+            }
+        });
 
-        restartBtn.addEventListener('click', () => {{
+        restartBtn.addEventListener('click', () => {
             currentFrame = 0;
             renderFrame(0);
-        }});
+        });
 
-        function loop() {{
+        function loop() {
             if (!isPlaying) return;
 
             const now = performance.now();
             const elapsed = now - lastFrameTime;
 
             // 60fps playback
-            if (elapsed >= 16.67) {{
+            if (elapsed >= 16.67) {
                 lastFrameTime = now;
 
-                if (currentFrame < frames.length - 1) {{
+                if (currentFrame < frames.length - 1) {
                     currentFrame++;
                     renderFrame(currentFrame);
-                }} else if (frames.complete) {{
+                } else if (frames.complete) {
                     isPlaying = false;
                     playPauseBtn.textContent = 'Play';
                     return;
-                }}
-            }}
+                }
+            }
 
             requestAnimationFrame(loop);
-        }}
+        }
 
         // Start playback loop
         loop();
 
         // Notify React Native that streaming started
-        if (window.ReactNativeWebView) {{
-            window.ReactNativeWebView.postMessage(JSON.stringify({{
+        if (window.ReactNativeWebView) {
+            window.ReactNativeWebView.postMessage(JSON.stringify({
                 type: 'streaming_started',
                 timestamp: Date.now()
-            }}));
-        }}
+            }));
+        }
     </script>
-"""
+""")
 
-    def _get_streaming_html_footer(self):
-        """Mark streaming as complete - SAFE version"""
-        return """
+_STREAMING_HTML_FOOTER = """
     <script>
-        frames.complete = true;
-        const statusEl = document.getElementById('status');
-        statusEl.textContent = '✓ COMPLETE ' + frames.length + ' frames loaded';
-        statusEl.style.color = '#0f0';
+        // Wait for any still-decoding packed frames before finalizing
+        pendingFrames.then(() => {
+            frames.complete = true;
+            const statusEl = document.getElementById('status');
+            statusEl.textContent = '✓ COMPLETE ' + frames.length + ' frames loaded';
+            statusEl.style.color = '#0f0';
 
-        // Notify React Native
-        if (window.ReactNativeWebView) {
-            window.ReactNativeWebView.postMessage(JSON.stringify({
-                type: 'streaming_complete',
-                totalFrames: frames.length,
-                timestamp: Date.now()
-            }));
-        }
+            // Notify React Native
+            if (window.ReactNativeWebView) {
+                window.ReactNativeWebView.postMessage(JSON.stringify({
+                    type: 'streaming_complete',
+                    totalFrames: frames.length,
+                    timestamp: Date.now()
+                }));
+            }
+        });
     </script>
 </body>
 </html>
 """
+
+
+class StreamingWebCamera(MovingCamera):
+    """Camera that streams frames as they're generated with MovingCamera support"""
+
+    # Fixed-point factor for streamed coordinates: canvas pixels are rounded
+    # to 1/8 px and shipped as int16, which is well below canvas rendering
+    # precision and far cheaper to serialize than float32. At a scale of 8
+    # the representable range is +/-4096 px, so far-offscreen points clip.
+    POINT_SCALE = 8
+
+    # Parallel columns of the per-frame mobject record, in draw order. A
+    # points_start of -1 marks a delta reference: reuse the cached entry for
+    # that id, style columns hold None.
+    _RECORD_COLUMNS = (
+        "id",
+        "points_start",
+        "points_end",
+        "fill_color",
+        "fill_opacity",
+        "stroke_color",
+        "stroke_width",
+        "stroke_opacity",
+    )
+
+    def __init__(self, *args, on_frame_callback=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.frame_data = {col: [] for col in self._RECORD_COLUMNS}
+        self.points_pool = []
+        self.on_frame_callback = on_frame_callback
+        self.frame_count = 0
+        # id(vm) -> content hash of the last emitted frame, used to replace
+        # unchanged mobjects with {"ref": id} entries between frames
+        self._prev_hashes: dict[int, int] = {}
+        # Scene-to-canvas affine of the previous frame; when it changes the
+        # delta cache is cleared, since streamed points are in canvas space
+        self._last_affine: tuple[float, float, float, float] | None = None
+        # Color strings are interned once per stream: columns carry small
+        # integer indices, frames only ship strings the viewer hasn't seen
+        self._color_table: dict[str, int] = {}
+        self.new_colors: list[str] = []
+
+    def _get_canvas_affine(self) -> tuple[float, float, float, float]:
+        """Scene-to-canvas transform as (a, tx, d, ty).
+
+        Maps scene coordinates to canvas pixels via ``x' = a*x + tx`` and
+        ``y' = d*y + ty`` (canvas y grows downward), folding the camera
+        frame's zoom/pan in so the JS side never transforms per point.
+        """
+        frame = self.frame
+        frame_width = float(frame.width)
+        frame_height = float(frame.height)
+        center_x, center_y = (float(c) for c in frame.get_center()[:2])
+        sx = self.pixel_width / frame_width
+        sy = self.pixel_height / frame_height
+        return (
+            sx,
+            (frame_width / 2 - center_x) * sx,
+            -sy,
+            (frame_height / 2 + center_y) * sy,
+        )
+
+    def reset_frame_data(self):
+        self.frame_data = {col: [] for col in self._RECORD_COLUMNS}
+        self.points_pool = []
+        self.new_colors = []
+
+    def _intern_color(self, color: str) -> int:
+        """Map a color string to its per-stream table index, registering it
+        in ``new_colors`` the first time it appears."""
+        index = self._color_table.get(color)
+        if index is None:
+            index = len(self._color_table)
+            self._color_table[color] = index
+            self.new_colors.append(color)
+        return index
+
+    @property
+    def num_captured_mobjects(self) -> int:
+        return len(self.frame_data["id"])
+
+    @staticmethod
+    def _get_render_style(vm: VMobject) -> tuple:
+        """Resolve the colors/opacities actually used for rendering.
+
+        The result is cached on the mobject so the hex formatting and float
+        coercions only rerun when the style actually changes. The cache
+        token is built from the rgbas arrays themselves - the state that
+        animations mutate in place (see ``VMobject.interpolate_color``) -
+        because the ``fill_color``/``stroke_color`` properties allocate a
+        fresh temporary per access, whose id can repeat across frames, and
+        the ``fill_opacity``/``stroke_opacity`` attributes are left
+        untouched by fades.
+        """
+        # Whether a mobject supports the rgbas accessors is a property of
+        # its class, so probe once per type instead of per call
+        cls = type(vm)
+        caps = _RGBAS_CAPABILITY.get(cls)
+        if caps is None:
+            caps = (hasattr(cls, "get_fill_rgbas"), hasattr(cls, "get_stroke_rgbas"))
+            _RGBAS_CAPABILITY[cls] = caps
+
+        # IMPORTANT: Use get_fill_rgbas() and get_stroke_rgbas() like Cairo
+        # does to get the actual colors/opacities used for rendering
+        fill_rgbas = vm.get_fill_rgbas() if caps[0] else None
+        stroke_rgbas = vm.get_stroke_rgbas() if caps[1] else None
+
+        token = (
+            fill_rgbas.tobytes() if fill_rgbas is not None else None,
+            stroke_rgbas.tobytes() if stroke_rgbas is not None else None,
+            vm.stroke_width,
+        )
+        cached = getattr(vm, "_cached_render_style", None)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+
+        fill_color = vm.fill_color
+        if isinstance(fill_color, ManimColor):
+            fill_color = _color_to_hex(fill_color)
+
+        stroke_color = vm.stroke_color
+        if isinstance(stroke_color, ManimColor):
+            stroke_color = _color_to_hex(stroke_color)
+
+        fill_opacity = float(vm.fill_opacity)
+        stroke_width = float(vm.stroke_width)
+        stroke_opacity = float(vm.stroke_opacity)
+
+        if fill_rgbas is not None and len(fill_rgbas) > 0:
+            # Use the alpha channel from the RGBA array (4th component)
+            fill_opacity = float(fill_rgbas[0][3])
+
+        if stroke_rgbas is not None and len(stroke_rgbas) > 0:
+            stroke_opacity = float(stroke_rgbas[0][3])
+
+        style = (fill_color, fill_opacity, stroke_color, stroke_width, stroke_opacity)
+        vm._cached_render_style = (token, style)
+        return style
+
+    def display_multiple_vectorized_mobjects(self, vmobjects: list[VMobject], pixel_array) -> None:
+        """Capture VMobject data"""
+        added_count = 0
+        skipped_count = 0
+        transparent_count = 0
+
+        unchanged_count = 0
+
+        # Streamed points are pre-transformed to canvas space, so cached
+        # entries go stale whenever the camera frame moves or zooms
+        affine = self._get_canvas_affine()
+        if affine != self._last_affine:
+            self._prev_hashes.clear()
+            self._last_affine = affine
+
+        # All point arrays for this frame get concatenated into one shared
+        # pool so NumPy -> Python conversion happens in a single pass rather
+        # than once per mobject; entries carry (start, end) indices into it.
+        point_arrays = []
+        n_points = 0
+
+        # Hashes of the mobjects seen this frame; replaces _prev_hashes at
+        # the end so ids of removed mobjects don't linger
+        seen_hashes: dict[int, int] = {}
+
+        # What's left of the per-mobject loop is interpreter overhead, so
+        # bind every hot attribute/method lookup to a local once per frame
+        # instead of re-resolving it on each iteration
+        cols = self.frame_data
+        append_id = cols["id"].append
+        append_points_start = cols["points_start"].append
+        append_points_end = cols["points_end"].append
+        append_fill_color = cols["fill_color"].append
+        append_fill_opacity = cols["fill_opacity"].append
+        append_stroke_color = cols["stroke_color"].append
+        append_stroke_width = cols["stroke_width"].append
+        append_stroke_opacity = cols["stroke_opacity"].append
+        append_points = point_arrays.append
+        get_render_style = self._get_render_style
+        intern_color = self._intern_color
+        prev_hash = self._prev_hashes.get
+
+        for vm in vmobjects:
+            # Skip mobjects with no points - they're invisible
+            points = vm.points
+            if points is None or len(points) == 0:
+                skipped_count += 1
+                continue
+
+            fill_color, fill_opacity, stroke_color, stroke_width, stroke_opacity = (
+                get_render_style(vm)
+            )
+
+            # Fully transparent mobjects can't mark the canvas; drop them
+            # before any hashing, interning or point copying happens
+            if fill_opacity == 0.0 and (stroke_width == 0.0 or stroke_opacity == 0.0):
+                transparent_count += 1
+                continue
+
+            fill_color = intern_color(fill_color)
+            stroke_color = intern_color(stroke_color)
+
+            # Delta-encode: if neither points nor style changed since the
+            # previous frame, emit a reference slot instead of a full one.
+            # The JS side resolves refs against a cache keyed by mobject id.
+            key = id(vm)
+            content_hash = hash(points.tobytes()) ^ hash(
+                (fill_color, stroke_color, fill_opacity, stroke_opacity, stroke_width)
+            )
+            seen_hashes[key] = content_hash
+            append_id(key)
+            if prev_hash(key) == content_hash:
+                append_points_start(-1)
+                append_points_end(-1)
+                append_fill_color(None)
+                append_fill_opacity(None)
+                append_stroke_color(None)
+                append_stroke_width(None)
+                append_stroke_opacity(None)
+                unchanged_count += 1
+                continue
+
+            append_points(points)
+            points_start = n_points
+            n_points += len(points)
+
+            append_points_start(points_start)
+            append_points_end(n_points)
+            append_fill_color(fill_color)
+            append_fill_opacity(fill_opacity)
+            append_stroke_color(stroke_color)
+            append_stroke_width(stroke_width)
+            append_stroke_opacity(stroke_opacity)
+            added_count += 1
+
+        self._prev_hashes = seen_hashes
+
+        if point_arrays:
+            # Transform to canvas space and quantize to fixed point in one
+            # kernel over the whole frame's concatenated points (jitted when
+            # numba is available). The pool stays an ndarray - orjson
+            # serializes it directly as a flat [x0, y0, x1, y1, ...] array;
+            # the JS side divides by points_scale when it materializes each
+            # mobject's coordinates.
+            a, tx, d, ty = affine
+            self.points_pool = _affine_quantize(
+                np.concatenate(point_arrays), a, tx, d, ty, float(self.POINT_SCALE)
+            )
+
+        if skipped_count > 0 or transparent_count > 0 or unchanged_count > 0:
+            logger.debug(f"  Added {added_count} mobjects ({unchanged_count} unchanged refs), skipped {skipped_count} with no points and {transparent_count} transparent")
+
+    def display_multiple_image_mobjects(self, image_mobjects, pixel_array):
+        pass
+
+    def display_multiple_point_cloud_mobjects(self, pmobjects, pixel_array):
+        pass
+
+
+class StreamingWebRenderer(CairoRenderer):
+    """
+    Streaming renderer that yields frames as they're generated.
+    Perfect for React Native integration and live preview!
+
+    Usage:
+        renderer = StreamingWebRenderer(on_frame=my_callback)
+        # Callback receives frames in real-time as they're generated
+
+    With ``binary_stream=True`` a ``stream.bin`` sidecar is written next to
+    the HTML: length-prefixed records (see ``_BIN_RECORD``) that native
+    consumers can follow without scraping script tags out of the HTML.
+    """
+
+    def __init__(self, *args, on_frame_callback=None, binary_stream=False, **kwargs):
+        self.on_frame_callback = on_frame_callback
+        self.binary_stream = binary_stream
+        super().__init__(
+            camera_class=StreamingWebCamera,
+            skip_animations=False,
+            *args,
+            **kwargs
+        )
+        self.camera.on_frame_callback = on_frame_callback
+        # Frames are streamed and dropped, never accumulated: memory stays
+        # O(1) in scene length. Only a counter and the index of the last
+        # fully-encoded frame (the hold/delta reference target) survive.
+        self.frame_count = 0
+        self._last_base_index: int | None = None
+        self.stream_file = None
+        self._stream_fh = None
+        self._binary_fh = None
+        self._write_queue: queue.Queue | None = None
+        self._writer_thread: threading.Thread | None = None
+        # (scene token, vmobjects) of the last family walk; see
+        # _get_stream_vmobjects
+        self._vmobject_cache: tuple[tuple, list[VMobject]] | None = None
+
+    @staticmethod
+    def _family_token(mobjects) -> tuple[int, ...]:
+        """Ids of every mobject in the family, at every depth.
+
+        A full recursive walk, so structural changes buried inside nested
+        groups (``become()``, ``align_data``, ``DecimalNumber.set_value``
+        swapping glyphs) invalidate the cache too. Collecting ids is still
+        far cheaper than ``extract_mobject_family_members`` with its
+        redundancy removal plus the isinstance filter.
+        """
+        token = []
+        stack = list(mobjects)
+        while stack:
+            mob = stack.pop()
+            token.append(id(mob))
+            stack.extend(mob.submobjects)
+        return tuple(token)
+
+    def _get_stream_vmobjects(self, scene) -> list[VMobject]:
+        """VMobjects to capture this frame, in draw order.
+
+        The family walk plus isinstance filter only reruns when the scene's
+        structure changes; animations overwhelmingly mutate points in place,
+        so consecutive frames share the same family. The cache token covers
+        the whole nested structure, and the walk deliberately keeps empty
+        mobjects (Create/Write grow points into an unchanged structure) -
+        the capture loop skips them per frame.
+        """
+        mobjects = scene.mobjects
+        token = self._family_token(mobjects)
+        cache = self._vmobject_cache
+        if cache is not None and cache[0] == token:
+            return cache[1]
+
+        all_mobjects = extract_mobject_family_members(mobjects)
+        vmobjects = [m for m in all_mobjects if isinstance(m, VMobject)]
+        self._vmobject_cache = (token, vmobjects)
+        return vmobjects
+
+    def init_scene(self, scene) -> None:
+        config.write_to_movie = False
+
+        # Create streaming HTML file
+        output_dir = config.media_dir
+        os.makedirs(output_dir, exist_ok=True)
+        stream_path = os.path.join(output_dir, "stream.html")
+
+        # Write initial HTML with live streaming capability
+        with open(stream_path, 'w') as f:
+            f.write(self._get_streaming_html_header())
+
+        self.stream_file = stream_path
+        # Keep one buffered handle open for the whole run instead of paying
+        # an open()/close() syscall pair per frame, and drain writes on a
+        # background thread so the render loop never blocks on disk
+        self._stream_fh = open(stream_path, 'ab', buffering=1 << 20)
+        if self.binary_stream:
+            binary_path = os.path.join(output_dir, "stream.bin")
+            self._binary_fh = open(binary_path, 'wb', buffering=1 << 20)
+            self._binary_fh.write(_BIN_MAGIC + struct.pack("<I", _BIN_VERSION))
+            logger.info(f"   Binary record stream at {binary_path}")
+        # Bounded so a slow disk applies backpressure: put() blocks the
+        # render loop instead of letting encoded frames pile up in memory
+        self._write_queue = queue.Queue(maxsize=256)
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="stream-writer", daemon=True
+        )
+        self._writer_thread.start()
+        logger.info(f"🔴 LIVE streaming to {stream_path}")
+
+        super().init_scene(scene)
+
+    def render(self, scene, time, moving_mobjects=None):
+        """Render frame and immediately stream it"""
+        self.camera.reset_frame_data()
+
+        # Capture frame - the full family walk (which includes text
+        # submobjects) is cached across frames with an unchanged structure
+        vmobjects = self._get_stream_vmobjects(scene)
+
+        # Debug: log mobject count every 30 frames
+        frame_index = self.frame_count
+        if frame_index % 30 == 0:
+            logger.info(f"Frame {frame_index}: {len(scene.mobjects)} scene mobjects, {len(vmobjects)} VMobjects captured")
+
+        self.camera.display_multiple_vectorized_mobjects(vmobjects, None)
+
+        # Debug: log actual frame_data length
+        if frame_index % 30 == 0:
+            logger.info(f"  Frame data contains {self.camera.num_captured_mobjects} mobjects with points")
+
+        # Capture camera frame transform (for zooming/panning)
+        camera_transform = {
+            "height": float(self.camera.frame.height),
+            "width": float(self.camera.frame.width),
+            "center": self.camera.frame.get_center().tolist(),
+            # Pixels per scene unit; points stream pre-transformed to canvas
+            # space, the JS side only needs this to scale tolerances
+            "scale": float(self.camera.pixel_width / self.camera.frame.width),
+        }
+
+        # Create frame data
+        frame_data = {
+            "time": time,
+            "frame_index": frame_index,
+            "mobjects": self.camera.frame_data,
+            "points_pool": self.camera.points_pool,
+            "points_scale": self.camera.POINT_SCALE,
+            "camera": camera_transform
+        }
+        # Color strings the viewer hasn't seen yet; columns carry indices
+        if self.camera.new_colors:
+            frame_data["new_colors"] = self.camera.new_colors
+
+        self.frame_count += 1
+        self._last_base_index = frame_index
+
+        # STREAM IT IMMEDIATELY!
+        self._stream_frame(frame_data)
+
+        # Also call user callback if provided
+        if self.on_frame_callback:
+            self.on_frame_callback(frame_data)
+
+    def _writer_loop(self) -> None:
+        """Drain queued chunks to the stream file; runs on its own thread.
+
+        Items are ``(handle, chunk)`` pairs so the HTML stream and the
+        optional binary sidecar share one thread and keep their relative
+        order. ``None`` is the shutdown sentinel, enqueued by
+        ``scene_finished``.
+
+        Whenever the queue goes idle the handles are flushed: the webview
+        polls the growing stream file live, and with delta/hold frames a
+        whole scene can fit inside the 1 MiB write buffer, which would
+        otherwise turn "live" into an end-of-run dump. Flushing here costs
+        the render thread nothing.
+        """
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+            handle, chunk = item
+            handle.write(chunk)
+            if self._write_queue.empty():
+                self._stream_fh.flush()
+                if self._binary_fh is not None:
+                    self._binary_fh.flush()
+
+    # Frames below this many encoded bytes ship uncompressed: gzip plus the
+    # base64 expansion only pays off on larger bodies
+    COMPRESS_THRESHOLD = 1024
+
+    def _stream_frame(self, frame_data):
+        """Append frame to HTML file in real-time"""
+        if not self._write_queue:
+            return
+
+        # Append frame data to JavaScript array. orjson encodes numpy arrays
+        # (the points pool) natively and formats numbers in C; the writer
+        # thread takes it from here.
+        payload = orjson.dumps(frame_data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+        # Optional binary sidecar: fixed-size record header + raw payload,
+        # gathered into a single buffer so each frame is one queue item and
+        # one write() per file. msgpack (when installed) keeps the points
+        # pool as raw bytes instead of a JSON number array; the record's
+        # encoding field tells consumers which decoder to use.
+        if self._binary_fh is not None:
+            if msgpack_imported:
+                bin_payload = msgpack.packb(frame_data, default=_msgpack_default)
+                encoding = _BIN_ENC_MSGPACK
+            else:
+                bin_payload = payload
+                encoding = _BIN_ENC_JSON
+            header = _BIN_RECORD.pack(
+                len(bin_payload), frame_data["frame_index"], encoding, 0
+            )
+            self._write_queue.put((self._binary_fh, header + bin_payload))
+
+        # Large bodies go gzip+base64 packed; the viewer inflates them with
+        # DecompressionStream. Level 1 already collapses the JSON's repeated
+        # digits/structure and keeps the CPU cost well below the bytes saved.
+        if len(payload) >= self.COMPRESS_THRESHOLD:
+            packed = base64.b64encode(gzip.compress(payload, compresslevel=1))
+            if len(packed) < len(payload):
+                self._write_queue.put((
+                    self._stream_fh,
+                    _FRAME_GZ_PREFIX + packed + _FRAME_GZ_SUFFIX,
+                ))
+                return
+
+        self._write_queue.put((
+            self._stream_fh,
+            _FRAME_PLAIN_PREFIX + payload + _FRAME_PLAIN_SUFFIX,
+        ))
+
+    def update_frame(self, scene, mobjects=None, **kwargs):
+        """Skip pixel rendering"""
+        pass
+
+    def freeze_current_frame(self, duration: float) -> None:
+        """Handle wait periods"""
+        dt = 1 / self.camera.frame_rate
+        num_frames = int(duration / dt)
+
+        if self._last_base_index is None or num_frames <= 0:
+            return
+
+        # A wait period streams as a single hold directive; the viewer
+        # expands it into num_frames frames referencing the last
+        # fully-encoded frame, so nothing is re-emitted per held frame.
+        hold_frame = {
+            "time": self.time + dt,
+            "frame_index": self.frame_count,
+            "ref_frame": self._last_base_index,
+            "dt": dt,
+            "hold_frames": num_frames,
+        }
+        self.time += dt * num_frames
+        # Count one slot per displayed frame so frame_index stays aligned
+        # with the viewer's expanded frames array
+        self.frame_count += num_frames
+        self._stream_frame(hold_frame)
+
+    def scene_finished(self, scene):
+        """Finalize the streaming HTML"""
+        if not self._stream_fh:
+            return
+
+        # Write closing HTML, flush the writer thread and release the handles
+        self._write_queue.put((self._stream_fh, self._get_streaming_html_footer().encode()))
+        self._write_queue.put(None)
+        self._writer_thread.join()
+        self._writer_thread = None
+        self._write_queue = None
+        self._stream_fh.close()
+        self._stream_fh = None
+        if self._binary_fh is not None:
+            self._binary_fh.close()
+            self._binary_fh = None
+
+        num_frames = self.frame_count
+        logger.info(f"✅ Streaming complete: {num_frames} frames")
+        logger.info(f"   Open {self.stream_file} in browser!")
+
+    def _get_streaming_html_header(self):
+        """HTML that loads and starts playing frames as they arrive"""
+        return _STREAMING_HTML_TEMPLATE.substitute(
+            pixel_width=config.pixel_width,
+            pixel_height=config.pixel_height,
+        )
+
+    def _get_streaming_html_footer(self):
+        """Mark streaming as complete - SAFE version"""
+        return _STREAMING_HTML_FOOTER
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+
+from manim import BLUE, Square
+from manim.renderer.streaming_web_renderer import StreamingWebCamera
+
+
+def test_streamed_opacity_tracks_rgbas_mutation():
+    camera = StreamingWebCamera()
+    square = Square(fill_color=BLUE, fill_opacity=0.2)
+
+    camera.display_multiple_vectorized_mobjects([square], None)
+    assert camera.frame_data["fill_opacity"][0] == pytest.approx(0.2)
+
+    # Fades write the rgbas arrays in place (VMobject.interpolate_color)
+    # without touching the fill_opacity attribute; the style cache must
+    # still pick the change up
+    square.fill_rgbas[:, 3] = 0.8
+    camera.reset_frame_data()
+    camera.display_multiple_vectorized_mobjects([square], None)
+    assert camera.frame_data["fill_opacity"][0] == pytest.approx(0.8)
+    # and the delta encoder must stream a full entry, not a stale ref
+    assert camera.frame_data["points_start"][0] >= 0